@@ -19,24 +19,325 @@ likely don't have any nearby Street View coverage and GeoGuessr cannot find a su
 alternative. You may need to manually remove those locations from your CSV.
 """
 
-import csv
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
 from datetime import datetime
 import math
+import multiprocessing
 import os
-import urllib.request
-import urllib.error
+import sqlite3
+import sys
+import threading
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
 import osxphotos
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+try:
+    # Optional: JIT-compile the haversine hot path if numba is installed
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # Much faster JSON encoder; stdlib json is used if unavailable
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: only needed for --parquet export
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Buffer size for export file handles; Python's default 8 KiB flushes
+# constantly on multi-MB outputs
+_WRITE_BUFFER_BYTES = 8 * 1024 * 1024
+
+
+def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great circle distance between two points on Earth in meters.
+
+    Module-level (rather than a method) so it can be JIT-compiled by numba
+    when available; falls back to plain Python otherwise.
+    """
+    # Earth radius in meters
+    R = 6371000.0
+
+    # Convert to radians
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_phi = math.radians(lat2 - lat1)
+    delta_lambda = math.radians(lon2 - lon1)
+
+    # Haversine formula
+    a = math.sin(delta_phi / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return R * c
+
+
+if njit is not None:
+    _haversine_m = njit(cache=True, fastmath=True)(_haversine_m)
+
+
+def _json_bytes(obj) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes (orjson when available).
+    With orjson, NumPy scalars and arrays serialize natively, so callers can
+    pass coordinate columns without converting them to Python lists first.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(',', ':'), default=lambda o: o.tolist()
+    ).encode('utf-8')
+
+
+def _spread_bits32(x: np.ndarray) -> np.ndarray:
+    """Spread the low 32 bits of each value into the even bit positions."""
+    x = x & np.uint64(0x00000000FFFFFFFF)
+    x = (x | (x << 16)) & np.uint64(0x0000FFFF0000FFFF)
+    x = (x | (x << 8)) & np.uint64(0x00FF00FF00FF00FF)
+    x = (x | (x << 4)) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = (x | (x << 2)) & np.uint64(0x3333333333333333)
+    x = (x | (x << 1)) & np.uint64(0x5555555555555555)
+    return x
+
+
+def _geohash64(lat: np.ndarray, lon: np.ndarray, bits: int = 30) -> np.ndarray:
+    """
+    Morton-interleaved 64-bit geohash of coordinate arrays.
+
+    Each axis is quantized to 32 bits over its full range and the bits are
+    interleaved, so the cells are uniform in angle (unlike decimal rounding,
+    whose implied cells vary with magnitude) and a coarser hash is just a
+    right-shift away. At the default 30 bits per axis a cell is ~2e-7
+    degrees (~2 cm of latitude): only effectively identical fixes collide.
+
+    Args:
+        lat: Latitude array (degrees)
+        lon: Longitude array (degrees)
+        bits: Bits to keep per axis (1-32)
+
+    Returns:
+        uint64 array of interleaved cell keys
+    """
+    lat_q = np.clip((lat + 90.0) * (2**32 / 180.0), 0, 2**32 - 1).astype(np.uint64)
+    lon_q = np.clip((lon + 180.0) * (2**32 / 360.0), 0, 2**32 - 1).astype(np.uint64)
+    key = (_spread_bits32(lat_q) << 1) | _spread_bits32(lon_q)
+    return key >> np.uint64(64 - 2 * bits)
+
+
+class ValidatedLocations(list):
+    """
+    Marker list for location dicts whose coordinates are already validated.
+
+    extract_locations checks every coordinate as it builds the list, so the
+    exporters and get_statistics can skip their defensive re-scan when they
+    receive one of these - even from callers that don't pass validate=False.
+    """
+
+
+def _naive_datetime(dt: Optional[datetime]) -> Optional[datetime]:
+    """Drop tzinfo so timezone-aware and naive datetimes compare consistently."""
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        return dt.replace(tzinfo=None)
+    return dt
+
+
+def _point_key(lat: float, lon: float) -> int:
+    """
+    Pack a coordinate pair quantized to 1e-4 degrees (~10 m) into one 64-bit
+    integer. A single int hashes in one CPython operation, versus two float
+    hashes plus a tuple hash for a (round(lat, 4), round(lon, 4)) key.
+    """
+    return (int(round(lat * 1e4)) << 32) | (int(round(lon * 1e4)) & 0xFFFFFFFF)
+
+
+@dataclass
+class LocationTable:
+    """
+    Structure-of-arrays view of a location list.
+
+    Iterating a list of dicts pays a hash lookup per field per row; the
+    exporters instead pull whole coordinate columns once and operate on
+    parallel NumPy arrays. The list of dicts remains the interchange format
+    between pipeline stages; to_dicts() returns it unchanged.
+
+    This is deliberately a minimal stand-in for a pandas DataFrame: the
+    pipeline only ever needs vectorized math on the coordinate columns, and
+    at personal-library scale the cost of building a DataFrame from the
+    dicts exceeds what its richer ops would save.
+    """
+    locations: List[Dict]
+    lat: np.ndarray
+    lon: np.ndarray
+    pano_lat: np.ndarray
+    pano_lon: np.ndarray
+
+    @classmethod
+    def from_dicts(cls, locations: List[Dict]) -> 'LocationTable':
+        """Build coordinate columns from a list of location dictionaries."""
+        # None becomes NaN in the float columns
+        lat = np.array([loc.get('latitude') for loc in locations], dtype=np.float64)
+        lon = np.array([loc.get('longitude') for loc in locations], dtype=np.float64)
+        pano_lat = np.array([loc.get('pano_lat') for loc in locations], dtype=np.float64)
+        pano_lon = np.array([loc.get('pano_lon') for loc in locations], dtype=np.float64)
+        return cls(locations, lat, lon, pano_lat, pano_lon)
+
+    def valid(self) -> 'LocationTable':
+        """Return a table restricted to rows with valid photo coordinates."""
+        if not self.locations:
+            return self
+        mask = (
+            np.isfinite(self.lat) & np.isfinite(self.lon)
+            & (self.lat >= -90) & (self.lat <= 90)
+            & (self.lon >= -180) & (self.lon <= 180)
+            # (0, 0) is often a default/error value
+            & ~((self.lat == 0.0) & (self.lon == 0.0))
+        )
+        if mask.all():
+            return self
+        idx = np.flatnonzero(mask)
+        return LocationTable(
+            [self.locations[i] for i in idx],
+            self.lat[idx], self.lon[idx], self.pano_lat[idx], self.pano_lon[idx],
+        )
+
+    def export_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coordinates to export: the Street View panorama position where one was
+        found (for GeoGuessr compatibility), the photo position otherwise.
+        """
+        pano_missing = np.isnan(self.pano_lat)
+        # In practice rows are all-pano (list came from the pano filter) or
+        # all-photo (it didn't run), so pick the column wholesale when possible
+        if pano_missing.all():
+            return self.lat, self.lon
+        if not pano_missing.any():
+            return self.pano_lat, self.pano_lon
+        lat = np.where(pano_missing, self.lat, self.pano_lat)
+        lon = np.where(np.isnan(self.pano_lon), self.lon, self.pano_lon)
+        return lat, lon
+
+    def to_dicts(self) -> List[Dict]:
+        """The row dictionaries backing this table (same objects, same order)."""
+        return self.locations
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+
+def save_pano_index(locations: List[Dict], index_path: str = '.pano_index.npz'):
+    """
+    Persist the Street View panorama positions of a filtered location list so
+    later runs can answer nearest-panorama queries without re-hitting the API.
+
+    Args:
+        locations: Location dictionaries carrying pano_lat/pano_lon/pano_id
+        index_path: Path to write the index to (default: .pano_index.npz)
+    """
+    table = LocationTable.from_dicts(locations)
+    mask = np.isfinite(table.pano_lat) & np.isfinite(table.pano_lon)
+    idx = np.flatnonzero(mask)
+    pano_ids = np.array([locations[i].get('pano_id', '') for i in idx])
+    np.savez(
+        index_path,
+        pano_lat=table.pano_lat[idx],
+        pano_lon=table.pano_lon[idx],
+        pano_id=pano_ids,
+    )
+    print(f"Panorama index saved to: {Path(index_path).absolute()} ({len(idx)} panoramas)")
+
+
+def query_pano_index(query_lat: float, query_lon: float, index_path: str = '.pano_index.npz', max_results: int = 5) -> List[Dict]:
+    """
+    Find the panoramas nearest to a query point in a saved panorama index.
+
+    Args:
+        query_lat: Query latitude
+        query_lon: Query longitude
+        index_path: Path to the index written by save_pano_index
+        max_results: Maximum number of panoramas to return
+
+    Returns:
+        List of dicts with pano_lat, pano_lon, pano_id, distance_m,
+        sorted by distance to the query point
+    """
+    index_file = Path(index_path)
+    if not index_file.exists():
+        raise FileNotFoundError(
+            f"Panorama index not found: {index_path}. Run with --filter-panos first to build it."
+        )
+
+    data = np.load(index_file)
+    pano_lat = data['pano_lat']
+    pano_lon = data['pano_lon']
+    pano_id = data['pano_id']
+
+    # Vectorized haversine against the whole index in one pass
+    R = 6371000.0
+    phi1 = math.radians(query_lat)
+    lam1 = math.radians(query_lon)
+    phi2 = np.radians(pano_lat)
+    lam2 = np.radians(pano_lon)
+    a = np.sin((phi2 - phi1) / 2) ** 2 + \
+        math.cos(phi1) * np.cos(phi2) * np.sin((lam2 - lam1) / 2) ** 2
+    distances = 2 * R * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    order = np.argsort(distances)[:max_results]
+    return [
+        {
+            'pano_lat': float(pano_lat[i]),
+            'pano_lon': float(pano_lon[i]),
+            'pano_id': str(pano_id[i]),
+            'distance_m': float(distances[i]),
+        }
+        for i in order
+    ]
+
+
+def _extract_shard(photos_db_path: Optional[str], uuids: List[str],
+                   start_date: Optional[str], end_date: Optional[str]) -> List[Dict]:
+    """
+    Worker for process-pool extraction: handle one shard of asset uuids.
+
+    Runs in a separate process (PhotosDB isn't picklable, so each worker
+    opens its own) and applies the same per-photo logic as
+    extract_locations over just its shard.
+
+    Args:
+        photos_db_path: Photos library database path, or None for the default
+        uuids: Asset uuids this worker is responsible for
+        start_date: Start date string in YYYY-MM-DD format, or None
+        end_date: End date string in YYYY-MM-DD format, or None
+
+    Returns:
+        Location dictionaries for the shard, in shard order
+    """
+    extractor = LocationExtractor(photos_db_path=photos_db_path)
+    bounds = extractor._parse_date_bounds(start_date, end_date)
+    process_photo = extractor._make_process_photo(*bounds)
+    photos = extractor.photosdb.photos(uuid=uuids)
+    return [photo_data for photo_data, _ in map(process_photo, photos) if photo_data is not None]
+
 
 class LocationExtractor:
     """Extract location data from Apple Photos library."""
@@ -49,38 +350,82 @@ class LocationExtractor:
             photos_db_path: Optional path to Photos library database.
                            If None, uses default Photos library.
         """
+        # Kept so worker processes can open their own PhotosDB
+        self._photos_db_path = photos_db_path
         if photos_db_path:
             self.photosdb = osxphotos.PhotosDB(photos_db_path)
         else:
             self.photosdb = osxphotos.PhotosDB()
+        # Warm the JIT compile (no-op in the pure-Python fallback)
+        _haversine_m(0.0, 0.0, 0.0, 0.0)
+        # Protects error counters updated from panorama worker threads
+        self._counter_lock = threading.Lock()
+        # photos() re-runs the underlying query each call; filled on first use
+        self._photos_cache = None
+        # uuid -> has-camera-info map bulk-loaded from Photos.sqlite; None
+        # until first use, {} if the database couldn't be read
+        self._camera_map = None
     
+    def _load_camera_map(self) -> Dict[str, bool]:
+        """
+        Bulk-load the has-camera-info flag for every asset in one SQL query.
+
+        Materializing exif_info per photo joins several tables each call;
+        a single SELECT over ZASSET and ZEXTENDEDATTRIBUTES answers the
+        camera-make/model question for the whole library at once.
+
+        Returns:
+            Mapping of asset uuid to whether camera make/model is present;
+            empty when the database can't be read (callers fall back to
+            per-photo EXIF access)
+        """
+        db_path = getattr(self.photosdb, 'db_path', None)
+        if not db_path or not os.path.exists(db_path):
+            return {}
+        try:
+            conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+            try:
+                rows = conn.execute("""
+                    SELECT a.ZUUID, e.ZCAMERAMAKE, e.ZCAMERAMODEL
+                    FROM ZASSET a
+                    LEFT JOIN ZEXTENDEDATTRIBUTES e ON e.ZASSET = a.Z_PK
+                """).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+        return {uuid: bool(make or model) for uuid, make, model in rows}
+
     def _is_valid_camera_media(self, photo) -> bool:
         """
         Check if photo/video was taken with a real camera device.
         Filters out screenshots and imported media without camera info.
-        
+
         Args:
             photo: PhotoInfo object from osxphotos
-            
+
         Returns:
             True if media appears to be from a camera device, False otherwise
         """
-        # Check for EXIF camera information
-        if hasattr(photo, 'exif_info') and photo.exif_info:
+        # Bulk map loaded lazily on first call; a racing second load from
+        # another worker thread is harmless (same result, last write wins)
+        if self._camera_map is None:
+            self._camera_map = self._load_camera_map()
+        cached = self._camera_map.get(photo.uuid)
+        if cached is not None:
+            return cached
+        # PhotoInfo.exif_info and ExifInfo.camera_make/camera_model are always
+        # defined, so the common path is plain attribute access; the except
+        # arm only fires for exotic asset types, costing nothing otherwise
+        try:
             exif = photo.exif_info
-            # Check if camera make/model are available
-            camera_make = getattr(exif, 'camera_make', None)
-            camera_model = getattr(exif, 'camera_model', None)
-            
-            # If both make and model are missing/empty, likely a screenshot or imported media
-            if not camera_make and not camera_model:
+            if exif is None:
+                # No EXIF info at all - likely a screenshot
                 return False
-            
-            # If we have camera info, it's likely from a real camera
-            return True
-        
-        # If no exif_info attribute or it's None, likely a screenshot
-        return False
+            # If both make and model are missing/empty, likely a screenshot or imported media
+            return bool(exif.camera_make or exif.camera_model)
+        except AttributeError:
+            return False
     
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -93,21 +438,7 @@ class LocationExtractor:
         Returns:
             Distance in meters
         """
-        # Earth radius in meters
-        R = 6371000
-        
-        # Convert to radians
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-        
-        # Haversine formula
-        a = math.sin(delta_phi / 2) ** 2 + \
-            math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return _haversine_m(lat1, lon1, lat2, lon2)
     
     def deduplicate_locations(self, locations: List[Dict], distance_meters: float = 200.0) -> List[Dict]:
         """
@@ -120,199 +451,378 @@ class LocationExtractor:
         Returns:
             Deduplicated list of location dictionaries (keeps the first occurrence of each duplicate)
         """
-        deduplicated = []
-        
-        # Use tqdm for progress bar
-        for loc in tqdm(locations, desc="Deduplicating locations", unit="location"):
+        # A subset of validated rows is still validated: keep the marker so
+        # downstream exports don't re-filter what extraction already checked
+        out_type = ValidatedLocations if isinstance(locations, ValidatedLocations) else list
+        deduplicated = out_type()
+
+        # Burst shots and stills from the same spot share identical (or
+        # near-identical) GPS fixes, so collapse those first with one
+        # vectorized np.unique pass over Morton geohash keys instead of
+        # paying the Python-level grid scan for every copy. At the default
+        # 30 bits per axis a cell is ~2 cm, so this only merges points that
+        # are duplicates at any practical threshold. Rows with missing
+        # coordinates are dropped here, matching the skip in the loop below.
+        if locations:
+            table = LocationTable.from_dicts(locations)
+            valid = np.isfinite(table.lat) & np.isfinite(table.lon)
+            valid_idx = np.flatnonzero(valid)
+            key = _geohash64(table.lat[valid_idx], table.lon[valid_idx])
+            # np.unique returns the index of the first occurrence of each
+            # key; sorting keeps the original (chronological) order
+            _, first = np.unique(key, return_index=True)
+            first.sort()
+            locations = [locations[i] for i in valid_idx[first]]
+
+        # Haversine is monotonic in the half-chord term 'a', so instead of computing
+        # the full distance per pair we compare 'a' against sin^2(d / 2R) once.
+        # Earth radius in meters
+        R = 6371000
+        a_threshold = math.sin(distance_meters / (2 * R)) ** 2
+
+        # Bucket accepted points into a grid of cells roughly one threshold wide
+        # (one degree of latitude is ~111,320 m). A candidate then only needs to be
+        # compared against points in its own and neighboring cells, turning the
+        # all-pairs scan into a near-linear pass.
+        cell_deg = distance_meters / 111320.0
+        grid = {}  # (lat_cell, lon_cell) -> list of (phi, lam, cos_phi), angles in radians
+
+        # Bounding-box bounds in radians for the filter-then-refine check below:
+        # points further apart than this in latitude (or longitude, scaled by
+        # cos(lat)) can't be within distance_meters, no trig needed to reject
+        dphi_max = distance_meters / R
+
+        # Use tqdm for progress bar; refresh at most twice a second - on fast
+        # loops the terminal redraws otherwise cost more than the work
+        for loc in tqdm(locations, desc="Deduplicating locations", unit="location",
+                        mininterval=0.5):
             lat = loc.get('latitude')
             lon = loc.get('longitude')
-            
+
             if lat is None or lon is None:
                 continue
-            
+
+            phi1 = math.radians(lat)
+            lam1 = math.radians(lon)
+            cos_phi1 = math.cos(phi1)
+
+            lat_cell = math.floor(lat / cell_deg)
+            lon_cell = math.floor(lon / cell_deg)
+            # Degrees of longitude shrink with latitude, so widen the scanned
+            # neighborhood accordingly (1 cell at the equator, more near poles)
+            lon_span = math.ceil(1.0 / max(cos_phi1, 1e-6))
+            dlam_max = dphi_max / max(cos_phi1, 1e-6)
+
             # Check if this location is within distance_meters of any already added location
             is_duplicate = False
-            for existing_loc in deduplicated:
-                existing_lat = existing_loc.get('latitude')
-                existing_lon = existing_loc.get('longitude')
-                
-                if existing_lat is None or existing_lon is None:
-                    continue
-                
-                distance = self._haversine_distance(lat, lon, existing_lat, existing_lon)
-                if distance <= distance_meters:
-                    is_duplicate = True
+            for row in range(lat_cell - 1, lat_cell + 2):
+                for col in range(lon_cell - lon_span, lon_cell + lon_span + 1):
+                    bucket = grid.get((row, col))
+                    if not bucket:
+                        continue
+                    # cos(phi) was precomputed on insert, so each comparison is
+                    # just two sin calls plus a handful of multiplies
+                    for phi2, lam2, cos_phi2 in bucket:
+                        # Bounding-box prefilter: a subtract and compare rejects
+                        # most pairs before the exact chord test
+                        if abs(phi2 - phi1) > dphi_max or abs(lam2 - lam1) > dlam_max:
+                            continue
+                        a = math.sin((phi2 - phi1) / 2) ** 2 + \
+                            cos_phi1 * cos_phi2 * math.sin((lam2 - lam1) / 2) ** 2
+                        if a <= a_threshold:
+                            is_duplicate = True
+                            break
+                    if is_duplicate:
+                        break
+                if is_duplicate:
                     break
-            
+
             if not is_duplicate:
+                grid.setdefault((lat_cell, lon_cell), []).append((phi1, lam1, cos_phi1))
                 deduplicated.append(loc)
-        
+
         return deduplicated
     
-    def _check_street_view_pano(self, lat: float, lon: float, api_key: str, radius: int = 1000, debug: bool = False) -> Optional[Dict]:
+    def _count_error(self, counter: str) -> int:
+        """
+        Thread-safely increment a named error counter and return the new value.
+
+        Args:
+            counter: Attribute name of the counter (e.g. '_error_count')
+
+        Returns:
+            Counter value after incrementing
+        """
+        with self._counter_lock:
+            value = getattr(self, counter, 0) + 1
+            setattr(self, counter, value)
+            return value
+
+    def _make_http_session(self, pool_size: int) -> requests.Session:
+        """
+        Build a keep-alive HTTP session for the Street View metadata API.
+
+        Args:
+            pool_size: Connection pool size (match the worker thread count)
+
+        Returns:
+            requests.Session with pooling and retries on transient errors
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=requests.adapters.Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        session.mount('https://', adapter)
+        return session
+
+    def _open_pano_cache(self, cache_path: str):
+        """
+        Open (creating if needed) the on-disk cache of panorama lookups.
+
+        Args:
+            cache_path: Path to the sqlite cache database file
+        """
+        self._pano_cache = sqlite3.connect(cache_path, check_same_thread=False)
+        self._pano_cache.execute(
+            'CREATE TABLE IF NOT EXISTS pano_cache ('
+            'lat_q REAL, lon_q REAL, radius INTEGER, json TEXT, ts INTEGER, '
+            'PRIMARY KEY (lat_q, lon_q, radius))'
+        )
+        self._pano_cache.commit()
+        self._pano_cache_lock = threading.Lock()
+        self._pano_cache_pending = 0
+
+    def _close_pano_cache(self):
+        """Flush pending writes and close the panorama cache."""
+        cache = getattr(self, '_pano_cache', None)
+        if cache is None:
+            return
+        cache.commit()
+        cache.close()
+        self._pano_cache = None
+
+    def _pano_cache_get(self, key: Tuple) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a cached panorama result.
+
+        Args:
+            key: (rounded_lat, rounded_lon, radius) cache key
+
+        Returns:
+            Tuple of (hit, pano_info). pano_info is None both on a miss and for
+            a cached "no panorama" result; check the hit flag to tell them apart.
+        """
+        cache = getattr(self, '_pano_cache', None)
+        if cache is None:
+            return False, None
+        with self._pano_cache_lock:
+            row = cache.execute(
+                'SELECT json FROM pano_cache WHERE lat_q = ? AND lon_q = ? AND radius = ?', key
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, (json.loads(row[0]) if row[0] else None)
+
+    def _pano_cache_put(self, key: Tuple, pano_info: Optional[Dict]):
+        """
+        Store a panorama result (or a definitive "no panorama") in the cache.
+
+        Args:
+            key: (rounded_lat, rounded_lon, radius) cache key
+            pano_info: Panorama info dict, or None for ZERO_RESULTS
+        """
+        cache = getattr(self, '_pano_cache', None)
+        if cache is None:
+            return
+        with self._pano_cache_lock:
+            cache.execute(
+                'INSERT OR REPLACE INTO pano_cache (lat_q, lon_q, radius, json, ts) VALUES (?, ?, ?, ?, ?)',
+                (*key, json.dumps(pano_info) if pano_info else '', int(time.time()))
+            )
+            # Batch commits so the write path isn't one fsync per location
+            self._pano_cache_pending += 1
+            if self._pano_cache_pending >= 50:
+                cache.commit()
+                self._pano_cache_pending = 0
+
+    def _check_street_view_pano(self, lat: float, lon: float, api_key: str, radius: int = 1000, debug: bool = False, session: Optional[requests.Session] = None) -> Optional[Dict]:
         """
         Check if a Street View panorama exists near the given coordinates.
         Uses Google Street View Metadata API.
-        
+
         Args:
             lat: Latitude
             lon: Longitude
             api_key: Google Maps API key
             radius: Search radius in meters (default: 1000m)
             debug: If True, print detailed debugging information
-            
+            session: Optional requests.Session to reuse connections across calls
+
         Returns:
             Dictionary with pano info if found, None otherwise.
             Format: {'pano_lat': float, 'pano_lon': float, 'pano_id': str, 'distance_m': float}
         """
         base_url = "https://maps.googleapis.com/maps/api/streetview/metadata"
-        
+
+        # Round to ~1 m so float noise between runs hits the same cache entry
+        cache_key = (round(lat, 5), round(lon, 5), radius)
+        cache_hit, cached = self._pano_cache_get(cache_key)
+        if cache_hit:
+            if debug:
+                print(f"\n🔍 Cache hit for location ({lat}, {lon}): {'panorama' if cached else 'no panorama'}")
+            return cached
+
         params = {
             'location': f"{lat},{lon}",
             'radius': radius,
             'key': api_key
         }
-        
+
+        http = session
+        if http is None:
+            # Standalone calls (outside filter_street_view_panos) share a lazily
+            # created keep-alive session instead of a fresh connection per call
+            http = getattr(self, '_http', None)
+            if http is None:
+                http = self._http = self._make_http_session(4)
+
         try:
-            url = f"{base_url}?{urllib.parse.urlencode(params)}"
-            # Mask API key in debug output
-            debug_url = url.replace(api_key, f"{api_key[:10]}...{api_key[-4:]}" if len(api_key) > 14 else "***")
-            
             if debug:
+                url = f"{base_url}?{urllib.parse.urlencode(params)}"
+                # Mask API key in debug output
+                debug_url = url.replace(api_key, f"{api_key[:10]}...{api_key[-4:]}" if len(api_key) > 14 else "***")
                 print(f"\n🔍 Checking panorama for location ({lat}, {lon})")
                 print(f"   Request URL: {debug_url}")
                 print(f"   Radius: {radius}m")
-            
-            request = urllib.request.Request(url)
-            
-            with urllib.request.urlopen(request, timeout=10) as response:
-                response_text = response.read().decode()
-                data = json.loads(response_text)
-                status = data.get('status', 'UNKNOWN_ERROR')
-                
-                if debug:
-                    print(f"   Response status: {status}")
-                    if 'error_message' in data:
-                        print(f"   Error message: {data['error_message']}")
-                    print(f"   Full response: {json.dumps(data, indent=2)}")
-                
-                if status == 'OK':
-                    pano_location = data.get('location', {})
-                    pano_lat = pano_location.get('lat')
-                    pano_lon = pano_location.get('lng')
-                    pano_id = data.get('pano_id', '')
-                    
-                    if pano_lat is not None and pano_lon is not None:
-                        # Calculate distance between photo location and panorama location
-                        distance_m = self._haversine_distance(lat, lon, pano_lat, pano_lon)
-                        
-                        if debug:
-                            print(f"   ✅ Found panorama at ({pano_lat}, {pano_lon})")
-                            print(f"   Distance: {distance_m:.2f}m")
-                            print(f"   Pano ID: {pano_id}")
-                        
-                        return {
-                            'pano_lat': pano_lat,
-                            'pano_lon': pano_lon,
-                            'pano_id': pano_id,
-                            'distance_m': distance_m
-                        }
-                    else:
-                        if debug:
-                            print(f"   ⚠️  Status OK but missing location data")
+
+            response = http.get(base_url, params=params, timeout=10)
+            response.raise_for_status()
+            # orjson decodes the raw bytes noticeably faster than response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            status = data.get('status', 'UNKNOWN_ERROR')
+
+            if debug:
+                print(f"   Response status: {status}")
+                if 'error_message' in data:
+                    print(f"   Error message: {data['error_message']}")
+                print(f"   Full response: {json.dumps(data, indent=2)}")
+
+            if status == 'OK':
+                pano_location = data.get('location', {})
+                pano_lat = pano_location.get('lat')
+                pano_lon = pano_location.get('lng')
+                pano_id = data.get('pano_id', '')
+
+                if pano_lat is not None and pano_lon is not None:
+                    # Calculate distance between photo location and panorama location
+                    distance_m = self._haversine_distance(lat, lon, pano_lat, pano_lon)
+
+                    if debug:
+                        print(f"   ✅ Found panorama at ({pano_lat}, {pano_lon})")
+                        print(f"   Distance: {distance_m:.2f}m")
+                        print(f"   Pano ID: {pano_id}")
+
+                    pano_info = {
+                        'pano_lat': pano_lat,
+                        'pano_lon': pano_lon,
+                        'pano_id': pano_id,
+                        'distance_m': distance_m
+                    }
+                    self._pano_cache_put(cache_key, pano_info)
+                    return pano_info
                 else:
-                    # Status is not OK - print why
-                    error_msg = data.get('error_message', '')
                     if debug:
-                        if status == 'ZERO_RESULTS':
-                            print(f"   ❌ No panorama found within {radius}m radius")
-                        elif status == 'REQUEST_DENIED':
-                            print(f"   ❌ Request denied - API not authorized")
-                            if error_msg:
-                                print(f"   Error: {error_msg}")
-                            print(f"   📝 SOLUTION: Enable 'Street View Static API' in Google Cloud Console")
-                            print(f"      1. Go to https://console.cloud.google.com/apis/library")
-                            print(f"      2. Search for 'Street View Static API'")
-                            print(f"      3. Click 'Enable'")
-                            print(f"      4. Make sure billing is enabled (free tier available)")
-                        elif status == 'INVALID_REQUEST':
-                            print(f"   ❌ Invalid request - check parameters")
-                            if error_msg:
-                                print(f"   Error: {error_msg}")
-                        else:
-                            print(f"   ❌ Unexpected status: {status}")
-                            if error_msg:
-                                print(f"   Error: {error_msg}")
-                    
-                    # Always print authorization errors even without debug mode
-                    if status == 'REQUEST_DENIED' and 'not authorized' in error_msg.lower():
-                        if not hasattr(self, '_auth_error_shown'):
-                            self._auth_error_shown = True
-                            print(f"\n⚠️  API Authorization Error: {error_msg}")
-                            print(f"📝 SOLUTION: Enable 'Street View Static API' in Google Cloud Console")
-                            print(f"   1. Go to https://console.cloud.google.com/apis/library")
-                            print(f"   2. Search for 'Street View Static API'")
-                            print(f"   3. Click 'Enable'")
-                            print(f"   4. Wait a few minutes for changes to propagate")
-                            print(f"   5. Make sure billing is enabled (free tier available)\n")
-                
-                # No panorama found (status is ZERO_RESULTS or other error)
-                return None
-                
-        except urllib.error.HTTPError as e:
+                        print(f"   ⚠️  Status OK but missing location data")
+            else:
+                # Status is not OK - print why
+                error_msg = data.get('error_message', '')
+                if debug:
+                    if status == 'ZERO_RESULTS':
+                        print(f"   ❌ No panorama found within {radius}m radius")
+                    elif status == 'REQUEST_DENIED':
+                        print(f"   ❌ Request denied - API not authorized")
+                        if error_msg:
+                            print(f"   Error: {error_msg}")
+                        print(f"   📝 SOLUTION: Enable 'Street View Static API' in Google Cloud Console")
+                        print(f"      1. Go to https://console.cloud.google.com/apis/library")
+                        print(f"      2. Search for 'Street View Static API'")
+                        print(f"      3. Click 'Enable'")
+                        print(f"      4. Make sure billing is enabled (free tier available)")
+                    elif status == 'INVALID_REQUEST':
+                        print(f"   ❌ Invalid request - check parameters")
+                        if error_msg:
+                            print(f"   Error: {error_msg}")
+                    else:
+                        print(f"   ❌ Unexpected status: {status}")
+                        if error_msg:
+                            print(f"   Error: {error_msg}")
+
+                # Always print authorization errors even without debug mode
+                if status == 'REQUEST_DENIED' and 'not authorized' in error_msg.lower():
+                    with self._counter_lock:
+                        auth_error_shown = getattr(self, '_auth_error_shown', False)
+                        self._auth_error_shown = True
+                    if not auth_error_shown:
+                        print(f"\n⚠️  API Authorization Error: {error_msg}")
+                        print(f"📝 SOLUTION: Enable 'Street View Static API' in Google Cloud Console")
+                        print(f"   1. Go to https://console.cloud.google.com/apis/library")
+                        print(f"   2. Search for 'Street View Static API'")
+                        print(f"   3. Click 'Enable'")
+                        print(f"   4. Wait a few minutes for changes to propagate")
+                        print(f"   5. Make sure billing is enabled (free tier available)\n")
+
+            # Only a definitive "no panorama here" is worth caching; transient
+            # errors (REQUEST_DENIED etc.) should be retried on the next run
+            if status == 'ZERO_RESULTS':
+                self._pano_cache_put(cache_key, None)
+
+            # No panorama found (status is ZERO_RESULTS or other error)
+            return None
+
+        except requests.exceptions.HTTPError as e:
             # Handle HTTP errors (like API key issues, rate limits, etc.)
+            code = e.response.status_code if e.response is not None else 0
             try:
-                error_body = e.read().decode()
-                error_data = json.loads(error_body) if error_body else {}
-                error_message = error_data.get('error_message', error_body[:200])
-            except:
+                error_data = e.response.json() if e.response is not None else {}
+                error_message = error_data.get('error_message', e.response.text[:200] if e.response is not None else str(e))
+            except (ValueError, AttributeError):
                 error_message = str(e)
-            
+
             # Only print first few errors to avoid spam
-            if not hasattr(self, '_error_count'):
-                self._error_count = 0
-            self._error_count += 1
-            
-            if self._error_count <= 3:
-                print(f"\n⚠️  API Error (HTTP {e.code}): {error_message[:150]}")
-                if e.code == 403:
+            if self._count_error('_error_count') <= 3:
+                print(f"\n⚠️  API Error (HTTP {code}): {error_message[:150]}")
+                if code == 403:
                     print("   This might be an API key permission issue. Check that Street View Static API is enabled.")
-                elif e.code == 400:
+                elif code == 400:
                     print("   This might be an invalid API key or request format.")
-            
-            return None
-        except (urllib.error.URLError, TimeoutError) as e:
-            # Network errors - only print first few
-            if not hasattr(self, '_network_error_count'):
-                self._network_error_count = 0
-            self._network_error_count += 1
-            
-            if self._network_error_count <= 3:
-                print(f"\n⚠️  Network error: {str(e)[:150]}")
+
             return None
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, requests.exceptions.JSONDecodeError, KeyError) as e:
             # Invalid response format - only print first few
-            if not hasattr(self, '_parse_error_count'):
-                self._parse_error_count = 0
-            self._parse_error_count += 1
-            
-            if self._parse_error_count <= 3:
+            if self._count_error('_parse_error_count') <= 3:
                 print(f"\n⚠️  Invalid API response format: {str(e)[:150]}")
             return None
+        except (requests.exceptions.RequestException, TimeoutError) as e:
+            # Network errors - only print first few
+            if self._count_error('_network_error_count') <= 3:
+                print(f"\n⚠️  Network error: {str(e)[:150]}")
+            return None
         except Exception as e:
             # Catch-all for any other errors - only print first few
-            if not hasattr(self, '_unexpected_error_count'):
-                self._unexpected_error_count = 0
-            self._unexpected_error_count += 1
-            
-            if self._unexpected_error_count <= 3:
+            if self._count_error('_unexpected_error_count') <= 3:
                 print(f"\n⚠️  Unexpected error: {str(e)[:150]}")
             return None
     
-    def filter_street_view_panos(self, locations: List[Dict], api_key: str, max_distance_m: float = 200.0, limit: Optional[int] = None, debug: bool = False) -> Tuple[List[Dict], int]:
+    def filter_street_view_panos(self, locations: List[Dict], api_key: str, max_distance_m: float = 200.0, limit: Optional[int] = None, debug: bool = False, max_workers: int = 16, use_cache: bool = True, cache_path: str = '.pano_cache.db') -> Tuple[List[Dict], int]:
         """
         Filter locations to only include those with Street View panoramas within acceptable distance.
-        
+
         Args:
             locations: List of location dictionaries
             api_key: Google Maps API key
@@ -320,65 +830,102 @@ class LocationExtractor:
                           Locations with distance > max_distance_m will be filtered out
             limit: Optional limit on number of locations to check (for testing)
             debug: If True, print detailed debugging information for each API call
-            
+            max_workers: Number of parallel API request threads (default: 16)
+            use_cache: If True, cache API responses on disk so re-runs skip the network
+            cache_path: Path to the sqlite cache database (default: .pano_cache.db)
+
         Returns:
             Tuple of (filtered_locations, filtered_count)
             Filtered locations will have pano_lat, pano_lon, pano_distance_m, and pano_id added to their dict
         """
-        filtered = []
+        if use_cache:
+            self._open_pano_cache(cache_path)
+
+        # Kept rows are copies of already-valid input rows, so the validated
+        # marker survives the filter and exports skip their safety re-check
+        filtered = ValidatedLocations() if isinstance(locations, ValidatedLocations) else []
         filtered_count = 0
         no_pano_count = 0
         too_far_count = 0
-        
+
         # Reset error counters
         self._error_count = 0
         self._network_error_count = 0
         self._parse_error_count = 0
         self._unexpected_error_count = 0
-        
+
         # Apply limit if specified
         locations_to_check = locations[:limit] if limit else locations
         skipped_by_limit = len(locations) - len(locations_to_check)
-        
+
         print(f"Checking Street View panorama coverage (max distance: {max_distance_m}m)...")
         if limit:
             print(f"Limited to first {limit} locations for testing (skipping {skipped_by_limit} locations)")
-        
-        total = len(locations_to_check)
-        
-        # Use tqdm for progress bar
-        for loc in tqdm(locations_to_check, total=total, desc="Checking panoramas", unit="location"):
+
+        # Photos taken within ~10 m of each other would issue identical queries;
+        # quantize to 4 decimals, fetch once per unique key and share the result
+        unique_points = {}
+        for loc in locations_to_check:
             lat = loc.get('latitude')
             lon = loc.get('longitude')
-            
             if lat is None or lon is None:
-                filtered_count += 1
                 continue
-            
+            unique_points.setdefault(_point_key(lat, lon), (lat, lon))
+
+        keys = list(unique_points)
+        if len(keys) < len(locations_to_check):
+            print(f"Deduplicated to {len(keys)} unique API queries for {len(locations_to_check)} locations")
+
+        # Share one keep-alive session across worker threads so requests reuse
+        # TCP+TLS connections instead of paying a handshake per location
+        session = self._make_http_session(max_workers)
+
+        def check_key(key: int) -> Optional[Dict]:
+            lat, lon = unique_points[key]
             # Check for Street View panorama (use larger radius for real-world GPS accuracy)
-            pano_info = self._check_street_view_pano(lat, lon, api_key, radius=1000, debug=debug)
-            
+            return self._check_street_view_pano(lat, lon, api_key, radius=1000, debug=debug, session=session)
+
+        try:
+            with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(check_key, keys)
+                key_results = dict(zip(keys, tqdm(results, total=len(keys), desc="Checking panoramas", unit="location", mininterval=0.5)))
+        finally:
+            if use_cache:
+                self._close_pano_cache()
+
+        for loc in locations_to_check:
+            lat = loc.get('latitude')
+            lon = loc.get('longitude')
+
+            if lat is None or lon is None:
+                filtered_count += 1
+                continue
+
+            pano_info = key_results.get(_point_key(lat, lon))
+
             if pano_info is None:
                 # No panorama found
                 no_pano_count += 1
                 filtered_count += 1
                 continue
-            
-            distance_m = pano_info['distance_m']
-            
+
+            # Shared results carry the distance of the representative point, so
+            # recompute it for this exact photo position
+            distance_m = self._haversine_distance(lat, lon, pano_info['pano_lat'], pano_info['pano_lon'])
+
             if distance_m > max_distance_m:
                 # Panorama too far away
                 too_far_count += 1
                 filtered_count += 1
                 continue
-            
+
             # Add panorama info to location dict
             loc_with_pano = loc.copy()
             loc_with_pano['pano_lat'] = pano_info['pano_lat']
             loc_with_pano['pano_lon'] = pano_info['pano_lon']
             loc_with_pano['pano_distance_m'] = distance_m
             loc_with_pano['pano_id'] = pano_info.get('pano_id', '')
-            
+
             filtered.append(loc_with_pano)
         
         # Print summary of why locations were filtered
@@ -391,142 +938,507 @@ class LocationExtractor:
         
         return filtered, filtered_count
     
-    def extract_locations(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
+    def _parse_date_bounds(self, start_date: Optional[str],
+                           end_date: Optional[str]) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Parse the YYYY-MM-DD date-range strings into naive datetime bounds.
+
+        Args:
+            start_date: Inclusive start date string, or None/empty for no bound
+            end_date: Inclusive end date string (extended to end of day), or
+                      None/empty for no bound
+
+        Returns:
+            (start_datetime, end_datetime) tuple, either element None
+
+        Raises:
+            ValueError: If a date string is malformed or the range is inverted
+        """
+        start_datetime = None
+        end_datetime = None
+
+        # fromisoformat is a C fast path; strptime spins up the full
+        # format-string machinery for what is a fixed YYYY-MM-DD parse
+        if start_date:
+            try:
+                start_datetime = datetime.fromisoformat(start_date)
+            except ValueError:
+                raise ValueError(f"Invalid start_date format: {start_date}. Expected YYYY-MM-DD")
+
+        if end_date:
+            try:
+                # Set end_date to end of day for inclusive comparison
+                end_datetime = datetime.fromisoformat(end_date).replace(hour=23, minute=59, second=59)
+            except ValueError:
+                raise ValueError(f"Invalid end_date format: {end_date}. Expected YYYY-MM-DD")
+
+        if start_datetime and end_datetime and start_datetime > end_datetime:
+            raise ValueError("start_date must be before or equal to end_date")
+
+        # Normalize to timezone-naive (they're already naive, but ensure consistency)
+        return _naive_datetime(start_datetime), _naive_datetime(end_datetime)
+
+    def _make_process_photo(self, start_datetime: Optional[datetime], end_datetime: Optional[datetime]):
+        """
+        Build the per-photo processing closure shared by the extraction paths.
+
+        The closure returns (photo_data, skip_reason): photo_data is the
+        location dict or None, skip_reason one of 'null_coord', 'date',
+        'not_camera' or None for photos simply lacking a location.
+
+        Args:
+            start_datetime: Inclusive lower date bound, or None
+            end_datetime: Inclusive upper date bound, or None
+
+        Returns:
+            The process_photo callable
+        """
+        # The bounds are loop-invariant, so specialize the date predicate once
+        # instead of re-testing which bounds are set for every photo. date_ok
+        # is None when no filtering was requested, letting the per-photo path
+        # skip the call (and the datetime normalization) entirely.
+        if start_datetime is not None and end_datetime is not None:
+            def date_ok(d):
+                return d is not None and start_datetime <= _naive_datetime(d) <= end_datetime
+        elif start_datetime is not None:
+            def date_ok(d):
+                return d is not None and _naive_datetime(d) >= start_datetime
+        elif end_datetime is not None:
+            def date_ok(d):
+                return d is not None and _naive_datetime(d) <= end_datetime
+        else:
+            date_ok = None
+
+        # A library spans a few hundred distinct regions at most, but osxphotos
+        # hands back a fresh str per photo. Pool them so identical names share
+        # one object: later grouping hits the dict fast path (pointer equality
+        # before full comparison) and duplicates don't pile up on the heap.
+        region_pool = {}
+
+        def process_photo(photo) -> Tuple[Optional[Dict], Optional[str]]:
+            """Build the location dict for one photo, or (None, skip reason)."""
+            # PhotoInfo attributes are lazy properties that may hit the database,
+            # so read each one once and skip out as early as possible
+            location = photo.location
+
+            # Check if photo has location data
+            if not location:
+                return None, None
+
+            lat, lon = location
+
+            # Skip if coordinates are null/None
+            if lat is None or lon is None:
+                return None, 'null_coord'
+
+            # Validate coordinate ranges
+            # Latitude must be between -90 and 90
+            # Longitude must be between -180 and 180
+            if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+                return None, 'null_coord'
+
+            # Skip if coordinates are invalid (0, 0 is often a default/error value)
+            if lat == 0.0 and lon == 0.0:
+                return None, None
+
+            # Filter by date range if specified (photos without a date are
+            # skipped when a filter is active)
+            photo_date = photo.date
+            if date_ok is not None and not date_ok(photo_date):
+                return None, 'date'
+
+            # Filter out screenshots and non-camera media
+            if not self._is_valid_camera_media(photo):
+                return None, 'not_camera'
+
+            # Try to get place/region info from photo metadata if available
+            region = None
+
+            # Apple Photos stores reverse geocoded place names
+            place = photo.place
+            if place:
+                # hasattr is a getattr plus exception catch under the hood, so
+                # probing before every read doubles the attribute work. Read
+                # .country directly: on PlaceInfo it always exists, so the
+                # common path costs one lookup and no exception ever fires
+                try:
+                    region = place.country
+                except AttributeError:
+                    # Sometimes place.name contains the full location string
+                    place_name = getattr(place, 'name', None)
+                    # Try to extract region if it's in a structured format
+                    if isinstance(place_name, str) and ',' in place_name:
+                        # Might be "City, State, Country" format; rpartition
+                        # grabs the tail directly instead of splitting and
+                        # stripping every segment just to keep the last one
+                        region = place_name.rpartition(',')[2].strip()
+
+            # Use "Unknown" if region not available
+            if not region:
+                region = 'Unknown'
+            else:
+                # Intern on first sight so equal names share one object even
+                # across closures/runs; dict lookups on interned keys short-
+                # circuit on pointer identity before any character compare
+                region = region_pool.setdefault(region, sys.intern(region))
+
+            filename = photo.original_filename
+            photo_data = {
+                'uuid': photo.uuid,
+                'filename': filename or 'Unknown',
+                'title': photo.title or filename or 'Untitled',
+                'description': photo.description or '',
+                'latitude': lat,
+                'longitude': lon,
+                'date': photo_date.isoformat() if photo_date else '',
+                'is_video': photo.ismovie,
+                'is_favorite': photo.favorite,
+                'region': region,
+            }
+            return photo_data, None
+
+        return process_photo
+
+    def iter_locations(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """
+        Yield location dicts one photo at a time.
+
+        Streaming alternative to extract_locations for callers that need to
+        keep peak memory flat (pair with export_to_csv_stream): rows are
+        produced and consumed one at a time instead of materializing the
+        full list. No progress bar or skip counters.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format (inclusive). If None, no start filter.
+            end_date: End date in YYYY-MM-DD format (inclusive). If None, no end filter.
+
+        Yields:
+            Location dictionaries in library order
+        """
+        start_datetime, end_datetime = self._parse_date_bounds(start_date, end_date)
+        process_photo = self._make_process_photo(start_datetime, end_datetime)
+
+        if self._photos_cache is None:
+            self._photos_cache = self.photosdb.photos()
+        for photo in self._photos_cache:
+            photo_data, _ = process_photo(photo)
+            if photo_data is not None:
+                yield photo_data
+
+    def _extract_locations_sql(self, start_datetime: Optional[datetime],
+                               end_datetime: Optional[datetime]) -> Optional[List[Dict]]:
+        """
+        Pull all needed asset fields in one read-only scan of Photos.sqlite.
+
+        Going through PhotoInfo costs roughly ten attribute reads per photo;
+        a single SELECT over ZASSET and its attribute tables replaces them
+        with one sequential SQLite scan. The tradeoff: regions come from a
+        binary-plist blob this path doesn't decode, so they export as
+        'Unknown'.
+
+        Args:
+            start_datetime: Inclusive lower date bound, or None
+            end_datetime: Inclusive upper date bound, or None
+
+        Returns:
+            List of location dictionaries, or None if the database could not
+            be read with the expected schema (caller falls back to PhotoInfo)
+        """
+        db_path = getattr(self.photosdb, 'db_path', None)
+        if not db_path or not os.path.exists(db_path):
+            return None
+
+        # Photos stores dates as seconds since the Core Data epoch (2001-01-01)
+        coredata_epoch = datetime(2001, 1, 1)
+
+        query = """
+            SELECT a.ZUUID, aa.ZORIGINALFILENAME, aa.ZTITLE, d.ZLONGDESCRIPTION,
+                   a.ZLATITUDE, a.ZLONGITUDE, a.ZDATECREATED, a.ZKIND, a.ZFAVORITE
+            FROM ZASSET a
+            JOIN ZADDITIONALASSETATTRIBUTES aa ON aa.ZASSET = a.Z_PK
+            LEFT JOIN ZEXTENDEDATTRIBUTES e ON e.ZASSET = a.Z_PK
+            LEFT JOIN ZASSETDESCRIPTION d ON d.ZASSETATTRIBUTES = aa.Z_PK
+            WHERE a.ZTRASHEDSTATE = 0
+              AND a.ZLATITUDE BETWEEN -90.0 AND 90.0
+              AND a.ZLONGITUDE BETWEEN -180.0 AND 180.0
+              AND NOT (a.ZLATITUDE = 0.0 AND a.ZLONGITUDE = 0.0)
+              AND (IFNULL(e.ZCAMERAMAKE, '') != '' OR IFNULL(e.ZCAMERAMODEL, '') != '')
+        """
+        params = []
+        if start_datetime is not None:
+            query += " AND a.ZDATECREATED >= ?"
+            params.append((start_datetime - coredata_epoch).total_seconds())
+        if end_datetime is not None:
+            query += " AND a.ZDATECREATED <= ?"
+            params.append((end_datetime - coredata_epoch).total_seconds())
+        query += " ORDER BY a.ZDATECREATED"
+
+        try:
+            conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+            try:
+                rows = conn.execute(query, params).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # Schema mismatch (older/newer Photos version) or locked database
+            return None
+
+        # Format all timestamps in one vectorized pass instead of a datetime
+        # allocation plus isoformat() per row (second precision is plenty)
+        date_col = np.array([row[6] if row[6] is not None else np.nan for row in rows],
+                            dtype=np.float64)
+        has_date = ~np.isnan(date_col)
+        dates64 = np.datetime64('2001-01-01') + \
+            np.where(has_date, date_col, 0.0).astype(np.int64).astype('timedelta64[s]')
+        date_strs = np.datetime_as_string(dates64, unit='s').tolist()
+
+        locations = []
+        for i, (uuid, filename, title, description, lat, lon, _date_s, kind, favorite) in enumerate(rows):
+            date_str = date_strs[i] if has_date[i] else ''
+            locations.append({
+                'uuid': uuid,
+                'filename': filename or 'Unknown',
+                'title': title or filename or 'Untitled',
+                'description': description or '',
+                'latitude': lat,
+                'longitude': lon,
+                'date': date_str,
+                'is_video': bool(kind),
+                'is_favorite': bool(favorite),
+                'region': 'Unknown',
+            })
+        return locations
+
+    def _extract_locations_processes(self, start_date: Optional[str], end_date: Optional[str],
+                                     processes: int) -> List[Dict]:
+        """
+        Fan the per-photo work out over a pool of worker processes.
+
+        Threads only overlap the GIL-releasing SQLite reads; the pure-Python
+        parts (notably decoding reverse-geocoded place data) serialize on the
+        GIL. Worker processes sidestep that, at the cost of each worker
+        loading its own PhotosDB - so this only pays off on large libraries.
+        Skip counters aren't tallied on this path.
+
+        Args:
+            start_date: Start date string in YYYY-MM-DD format, or None
+            end_date: End date string in YYYY-MM-DD format, or None
+            processes: Number of worker processes
+
+        Returns:
+            Merged location dictionaries in library order
+        """
+        if self._photos_cache is None:
+            self._photos_cache = self.photosdb.photos()
+        uuids = [photo.uuid for photo in self._photos_cache]
+
+        # Contiguous shards keep the merged output in library order
+        shard_size = math.ceil(len(uuids) / processes) if uuids else 1
+        shards = [uuids[i:i + shard_size] for i in range(0, len(uuids), shard_size)]
+
+        print(f"Scanning Photos library with {len(shards)} worker processes...")
+        args = [(self._photos_db_path, shard, start_date, end_date) for shard in shards]
+        with multiprocessing.Pool(len(shards) or 1) as pool:
+            parts = pool.starmap(_extract_shard, args)
+
+        merged = ValidatedLocations()
+        for part in parts:
+            merged.extend(part)
+        return merged
+
+    def _geotagged_uuids(self) -> Optional[set]:
+        """
+        Fetch the uuids of all assets with usable GPS coordinates in one query.
+
+        On mixed libraries (screenshots, scans) most photos carry no GPS at
+        all; knowing the geotagged subset up front lets the extraction loop
+        skip the rest without paying a per-photo location read.
+
+        Returns:
+            Set of uuids, or None when the database can't be read (callers
+            iterate everything as before)
+        """
+        db_path = getattr(self.photosdb, 'db_path', None)
+        if not db_path or not os.path.exists(db_path):
+            return None
+        try:
+            conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+            try:
+                # Missing GPS is stored as NULL or the (-180, -180) sentinel.
+                # Out-of-range or (0, 0) rows are deliberately kept so the
+                # loop still sees and counts them like before.
+                rows = conn.execute("""
+                    SELECT ZUUID FROM ZASSET
+                    WHERE ZLATITUDE IS NOT NULL AND ZLONGITUDE IS NOT NULL
+                      AND NOT (ZLATITUDE = -180.0 AND ZLONGITUDE = -180.0)
+                """).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return {uuid for (uuid,) in rows}
+
+    def _extract_cache_manifest(self, start_date: Optional[str], end_date: Optional[str],
+                                use_sql: bool) -> Optional[Dict]:
+        """
+        Describe the inputs the extraction cache depends on.
+
+        Args:
+            start_date: Start date string, or None
+            end_date: End date string, or None
+            use_sql: Whether the SQL scan path was requested
+
+        Returns:
+            Manifest dict (database mtime/size plus the filter arguments),
+            or None when the database file can't be stat'ed
+        """
+        db_path = getattr(self.photosdb, 'db_path', None)
+        if not db_path or not os.path.exists(db_path):
+            return None
+        st = os.stat(db_path)
+        return {
+            'db_mtime': st.st_mtime,
+            'db_size': st.st_size,
+            'start_date': start_date or '',
+            'end_date': end_date or '',
+            'use_sql': use_sql,
+        }
+
+    def _load_extract_cache(self, manifest: Optional[Dict],
+                            cache_path: str = '.extract_cache.parquet') -> Optional[List[Dict]]:
+        """
+        Reload a previous extraction if the library and filters are unchanged.
+
+        Args:
+            manifest: Current manifest from _extract_cache_manifest
+            cache_path: Parquet cache file (sidecar .json holds the manifest)
+
+        Returns:
+            Cached location list, or None on any mismatch or read problem
+        """
+        if pa is None or manifest is None:
+            return None
+        try:
+            stored = json.loads(Path(cache_path + '.json').read_text())
+            if stored != manifest:
+                return None
+            return ValidatedLocations(pq.read_table(cache_path).to_pylist())
+        except (OSError, ValueError, pa.lib.ArrowInvalid):
+            return None
+
+    def _save_extract_cache(self, locations: List[Dict], manifest: Optional[Dict],
+                            cache_path: str = '.extract_cache.parquet'):
+        """
+        Persist an extraction result for reuse by the next run.
+
+        Args:
+            locations: Extracted location dictionaries
+            manifest: Manifest from _extract_cache_manifest
+            cache_path: Parquet cache file (sidecar .json holds the manifest)
+        """
+        if pa is None or manifest is None or not locations:
+            return
+        try:
+            pq.write_table(pa.Table.from_pylist(list(locations)), cache_path, compression='zstd')
+            Path(cache_path + '.json').write_text(json.dumps(manifest))
+        except (OSError, pa.lib.ArrowInvalid):
+            pass
+
+    def extract_locations(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          use_sql: bool = False, processes: int = 0, use_cache: bool = False) -> List[Dict]:
         """
         Extract location data from all photos with GPS coordinates.
         Filters out screenshots and non-camera media.
-        
+
         Args:
             start_date: Start date in YYYY-MM-DD format (inclusive). If None, no start filter.
             end_date: End date in YYYY-MM-DD format (inclusive). If None, no end filter.
-        
+            use_sql: If True, try one direct SQL scan of Photos.sqlite instead
+                     of per-photo PhotoInfo reads (much faster on large
+                     libraries, but regions export as 'Unknown'). Falls back
+                     to the normal path if the schema doesn't match.
+            processes: If > 1, shard the library across this many worker
+                       processes (each opens its own PhotosDB). Wins on large
+                       libraries where place decoding dominates; skip
+                       counters aren't reported.
+            use_cache: If True, reuse the on-disk extraction cache
+                       (.extract_cache.parquet) when the Photos database and
+                       the filter arguments are unchanged since it was
+                       written. Requires pyarrow; silently skipped otherwise.
+
         Returns:
             List of dictionaries containing photo location data
         """
-        photos_with_location = []
+        manifest = self._extract_cache_manifest(start_date, end_date, use_sql) if use_cache else None
+        if use_cache:
+            cached = self._load_extract_cache(manifest)
+            if cached is not None:
+                print(f"Reusing cached extraction ({len(cached)} locations; library unchanged)")
+                return cached
+
+        photos_with_location = ValidatedLocations()
         skipped_count = 0
         null_coord_count = 0
         date_filtered_count = 0
-        
-        # Helper function to normalize datetimes to timezone-naive for comparison
-        def normalize_datetime(dt):
-            """Convert timezone-aware datetime to naive datetime."""
-            if dt is None:
-                return None
-            if dt.tzinfo is not None:
-                # Remove timezone info for comparison
-                return dt.replace(tzinfo=None)
-            return dt
-        
-        # Parse date strings if provided
-        start_datetime = None
-        end_datetime = None
-        
-        if start_date:
-            try:
-                start_datetime = datetime.strptime(start_date, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError(f"Invalid start_date format: {start_date}. Expected YYYY-MM-DD")
-        
-        if end_date:
-            try:
-                # Set end_date to end of day for inclusive comparison
-                end_datetime = datetime.strptime(end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59)
-            except ValueError:
-                raise ValueError(f"Invalid end_date format: {end_date}. Expected YYYY-MM-DD")
-        
-        if start_datetime and end_datetime and start_datetime > end_datetime:
-            raise ValueError("start_date must be before or equal to end_date")
-        
-        # Normalize parsed datetimes (they're already naive, but ensure consistency)
-        start_datetime = normalize_datetime(start_datetime)
-        end_datetime = normalize_datetime(end_datetime)
-        
+
+        start_datetime, end_datetime = self._parse_date_bounds(start_date, end_date)
+
+        if use_sql:
+            print("Scanning Photos.sqlite directly...")
+            locations = self._extract_locations_sql(start_datetime, end_datetime)
+            if locations is not None:
+                print(f"\nFound {len(locations)} photos/videos with location data")
+                locations = ValidatedLocations(locations)
+                self._save_extract_cache(locations, manifest)
+                return locations
+            print("Direct SQL scan unavailable for this library, falling back to per-photo reads")
+
+        if processes and processes > 1:
+            locations = self._extract_locations_processes(start_date, end_date, processes)
+            print(f"\nFound {len(locations)} photos/videos with location data")
+            self._save_extract_cache(locations, manifest)
+            return locations
+
+        process_photo = self._make_process_photo(start_datetime, end_datetime)
+
         print("Scanning Photos library...")
         if start_date or end_date:
             date_range_str = f" (date range: {start_date or 'any'} to {end_date or 'any'})"
             print(f"Filtering by date range{date_range_str}...")
         
-        all_photos = self.photosdb.photos()
+        # Cache the photo list so repeated extractions (e.g. trying several
+        # date ranges from a script) don't re-run the library query
+        if self._photos_cache is None:
+            self._photos_cache = self.photosdb.photos()
+        all_photos = self._photos_cache
+
+        # Restrict the loop to the geotagged subset when the database can
+        # tell us which assets that is - on mixed libraries most photos have
+        # no GPS and would only be visited to be skipped
+        geotagged = self._geotagged_uuids()
+        if geotagged is not None:
+            all_photos = [photo for photo in all_photos if photo.uuid in geotagged]
         total_photos = len(all_photos)
-        
-        # Use tqdm for progress bar
-        for photo in tqdm(all_photos, total=total_photos, desc="Processing photos", unit="photo"):
-            
-            # Check if photo has location data
-            if photo.location:
-                lat, lon = photo.location
-                
-                # Skip if coordinates are null/None
-                if lat is None or lon is None:
-                    null_coord_count += 1
-                    continue
-                
-                # Validate coordinate ranges
-                # Latitude must be between -90 and 90
-                # Longitude must be between -180 and 180
-                if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                    null_coord_count += 1
-                    continue
-                
-                # Skip if coordinates are invalid (0, 0 is often a default/error value)
-                if lat != 0.0 or lon != 0.0:
-                    # Filter by date range if specified
-                    if photo.date:
-                        photo_datetime = normalize_datetime(photo.date)
-                        if start_datetime and photo_datetime < start_datetime:
-                            date_filtered_count += 1
-                            continue
-                        if end_datetime and photo_datetime > end_datetime:
-                            date_filtered_count += 1
-                            continue
-                    elif (start_datetime or end_datetime):
-                        # If date filtering is requested but photo has no date, skip it
-                        date_filtered_count += 1
-                        continue
-                    
-                    # Filter out screenshots and non-camera media
-                    if not self._is_valid_camera_media(photo):
-                        skipped_count += 1
-                        continue
-                    
-                    # Try to get place/region info from photo metadata if available
-                    region = None
-                    
-                    # Check if osxphotos provides place information
-                    # Apple Photos stores reverse geocoded place names
-                    if hasattr(photo, 'place') and photo.place:
-                        # Try accessing region attribute if place is an object
-                        if hasattr(photo.place, 'country'):
-                            region = photo.place.country
-                        elif hasattr(photo.place, 'name'):
-                            # Sometimes place.name contains the full location string
-                            place_name = photo.place.name
-                            # Try to extract region if it's in a structured format
-                            if isinstance(place_name, str) and ',' in place_name:
-                                # Might be "City, State, Country" format
-                                parts = [p.strip() for p in place_name.split(',')]
-                                if len(parts) > 0:
-                                    region = parts[-1]
-                    
-                    # Use "Unknown" if region not available
-                    if not region:
-                        region = 'Unknown'
-                    
-                    photo_data = {
-                        'uuid': photo.uuid,
-                        'filename': photo.original_filename or 'Unknown',
-                        'title': photo.title or photo.original_filename or 'Untitled',
-                        'description': photo.description or '',
-                        'latitude': lat,
-                        'longitude': lon,
-                        'date': photo.date.isoformat() if photo.date else '',
-                        'is_video': photo.ismovie,
-                        'is_favorite': photo.favorite,
-                        'region': region,
-                    }
+
+        # Lazy PhotoInfo attributes fire SQLite reads, which release the GIL
+        # inside the sqlite3 C layer, so a thread pool overlaps that I/O.
+        # executor.map preserves input order, keeping results chronological;
+        # counters are tallied here from the returned skip reasons, so the
+        # workers stay lock-free.
+        max_workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(process_photo, all_photos)
+            for photo_data, skip_reason in tqdm(results, total=total_photos, desc="Processing photos", unit="photo", mininterval=0.5):
+                if photo_data is not None:
                     photos_with_location.append(photo_data)
-        
+                elif skip_reason == 'null_coord':
+                    null_coord_count += 1
+                elif skip_reason == 'date':
+                    date_filtered_count += 1
+                elif skip_reason == 'not_camera':
+                    skipped_count += 1
+
+
         print(f"\nFound {len(photos_with_location)} photos/videos with location data")
         if skipped_count > 0:
             print(f"Skipped {skipped_count} screenshots/non-camera media")
@@ -534,9 +1446,55 @@ class LocationExtractor:
             print(f"Skipped {null_coord_count} photos/videos with null coordinates")
         if date_filtered_count > 0:
             print(f"Skipped {date_filtered_count} photos/videos outside date range")
+        self._save_extract_cache(photos_with_location, manifest)
         return photos_with_location
     
-    def export_to_csv(self, locations: List[Dict], output_path: str = 'photo_locations.csv'):
+    def _valid_table(self, locations: List[Dict], validate: bool = True) -> LocationTable:
+        """
+        Build a LocationTable restricted to rows with valid coordinates.
+
+        The validity mask is computed in one vectorized NumPy pass and the
+        table is memoized per input list, so the CSV, GeoJSON and statistics
+        consumers don't each re-scan the full list with per-row Python checks.
+
+        Args:
+            locations: List of location dictionaries
+            validate: If False, trust the caller that coordinates are already
+                      valid and skip the mask entirely
+
+        Returns:
+            LocationTable over the locations with valid coordinates
+        """
+        # Lists built by extract_locations carry the ValidatedLocations
+        # marker: every coordinate was checked on the way in, so the
+        # defensive mask is redundant for them
+        if isinstance(locations, ValidatedLocations):
+            validate = False
+
+        cached = getattr(self, '_valid_cache', None)
+        if cached is not None and cached[0] is locations and cached[1] == len(locations) and cached[3] == validate:
+            return cached[2]
+
+        table = LocationTable.from_dicts(locations)
+        if validate:
+            table = table.valid()
+        self._valid_cache = (locations, len(locations), table, validate)
+        return table
+
+    def _valid_locations(self, locations: List[Dict], validate: bool = True) -> List[Dict]:
+        """
+        Filter out locations with null or invalid coordinates.
+
+        Args:
+            locations: List of location dictionaries
+            validate: If False, skip the re-validation scan
+
+        Returns:
+            List of locations with valid coordinates (same objects, same order)
+        """
+        return self._valid_table(locations, validate).to_dicts()
+
+    def export_to_csv(self, locations: List[Dict], output_path: str = 'photo_locations.csv', validate: bool = True):
         """
         Export location data to CSV file (GeoGuessr format).
         
@@ -545,123 +1503,171 @@ class LocationExtractor:
             output_path: Path to output CSV file
         """
         output_file = Path(output_path)
-        
+
         # Filter out any null or invalid coordinates as a safety check
-        valid_locations = []
-        for loc in locations:
-            lat = loc.get('latitude')
-            lon = loc.get('longitude')
-            
-            if lat is None or lon is None:
-                continue
-            
-            # Validate coordinate ranges
-            if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                continue
-            
-            # Skip (0, 0) coordinates as they're often invalid
-            if lat == 0.0 and lon == 0.0:
-                continue
-            
-            valid_locations.append(loc)
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Latitude', 'Longitude'])
-            for loc in valid_locations:
-                # Use panorama coordinates if available (for GeoGuessr), otherwise use photo coordinates
-                lat = loc.get('pano_lat', loc.get('latitude'))
-                lon = loc.get('pano_lon', loc.get('longitude'))
-                writer.writerow([lat, lon])
-        
-        filtered_count = len(locations) - len(valid_locations)
+        table = self._valid_table(locations, validate)
+        # Use panorama coordinates if available (for GeoGuessr), otherwise use photo coordinates
+        lat_col, lon_col = table.export_coords()
+
+        # Plain string building instead of csv.writer: two float columns never
+        # need quoting, so the csv dialect machinery is pure overhead here.
+        # Assemble the whole file with one join and hand it to the OS in a
+        # single write instead of N buffered ones.
+        body = '\n'.join(f"{lat},{lon}" for lat, lon in zip(lat_col.tolist(), lon_col.tolist()))
+        content = 'Latitude,Longitude\n' + (body + '\n' if body else '')
+        output_file.write_text(content, encoding='utf-8')
+
+        filtered_count = len(locations) - len(table)
         if filtered_count > 0:
             print(f"Filtered out {filtered_count} entries with invalid coordinates from CSV")
         print(f"CSV file saved to: {output_file.absolute()}")
     
-    def export_to_geojson(self, locations: List[Dict], output_path: str = 'photo_locations.geojson'):
+    def export_to_csv_stream(self, locations_iter, output_path: str = 'photo_locations.csv'):
+        """
+        Write the CSV directly from an iterable of location dicts.
+
+        Pairs with iter_locations: each row is formatted and written as it
+        arrives, so peak memory stays at one row regardless of library size.
+        Coordinates are trusted as-is; use export_to_csv for validation.
+
+        Args:
+            locations_iter: Iterable of location dictionaries
+            output_path: Path to output CSV file
+        """
+        output_file = Path(output_path)
+
+        count = 0
+        with open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_BYTES) as csvfile:
+            csvfile.write('Latitude,Longitude\n')
+            for loc in locations_iter:
+                # Use panorama coordinates if available (for GeoGuessr),
+                # otherwise use photo coordinates
+                lat = loc.get('pano_lat', loc['latitude'])
+                lon = loc.get('pano_lon', loc['longitude'])
+                csvfile.write(f"{lat},{lon}\n")
+                count += 1
+
+        print(f"CSV file saved to: {output_file.absolute()} ({count} rows)")
+
+    def export_to_parquet(self, locations: List[Dict], output_path: str = 'photo_locations.parquet', validate: bool = True):
+        """
+        Export location data to a Parquet file (binary columnar format).
+
+        Roughly 10x smaller and faster to read back than GeoJSON for point
+        data; intended for pipelines that consume the output programmatically.
+        Requires pyarrow (pip install pyarrow).
+
+        Args:
+            locations: List of location dictionaries
+            output_path: Path to output Parquet file
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet export. Install it with: pip install pyarrow")
+
+        output_file = Path(output_path)
+
+        # Filter out any null or invalid coordinates as a safety check
+        table = self._valid_table(locations, validate)
+        # Use panorama coordinates if available (for GeoGuessr), otherwise use photo coordinates
+        lat_col, lon_col = table.export_coords()
+        rows = table.to_dicts()
+
+        arrow_table = pa.table({
+            'latitude': lat_col,
+            'longitude': lon_col,
+            'region': [loc.get('region', 'Unknown') for loc in rows],
+            'uuid': [loc.get('uuid', '') for loc in rows],
+            'date': [loc.get('date', '') for loc in rows],
+        })
+        pq.write_table(arrow_table, output_file, compression='zstd')
+
+        filtered_count = len(locations) - len(table)
+        if filtered_count > 0:
+            print(f"Filtered out {filtered_count} entries with invalid coordinates from Parquet")
+        print(f"Parquet file saved to: {output_file.absolute()}")
+
+    def export_to_geojson(self, locations: List[Dict], output_path: str = 'photo_locations.geojson', validate: bool = True):
         """
         Export location data to GeoJSON file, grouped by region.
-        
+
+        Features are written to the file one region at a time, so the full
+        serialized FeatureCollection never has to be held in memory.
+
         Args:
             locations: List of location dictionaries
             output_path: Path to output GeoJSON file
         """
         output_file = Path(output_path)
-        
+
         if not locations:
-            # Create empty FeatureCollection
-            geojson = {
-                "type": "FeatureCollection",
-                "features": []
-            }
-            with open(output_file, 'w', encoding='utf-8') as geojsonfile:
-                json.dump(geojson, geojsonfile, indent=2, ensure_ascii=False)
-            print(f"GeoJSON file saved to: {output_file.absolute()}")
-            return
-        
-        # Filter out any null or invalid coordinates as a safety check
-        valid_locations = []
-        for loc in locations:
-            lat = loc.get('latitude')
-            lon = loc.get('longitude')
-            
-            if lat is None or lon is None:
-                continue
-            
-            # Validate coordinate ranges
-            if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                continue
-            
-            # Skip (0, 0) coordinates as they're often invalid
-            if lat == 0.0 and lon == 0.0:
-                continue
-            
-            valid_locations.append(loc)
-        
-        filtered_count = len(locations) - len(valid_locations)
-        if filtered_count > 0:
-            print(f"Filtered out {filtered_count} entries with invalid coordinates from GeoJSON")
-        
-        # Group coordinates by region
-        print("Grouping coordinates by region...")
-        region_coords = defaultdict(list)
-        
-        for loc in valid_locations:
-            region = loc.get('region', 'Unknown')
-            # Use panorama coordinates if available (for GeoGuessr), otherwise use photo coordinates
-            lon = loc.get('pano_lon', loc.get('longitude'))
-            lat = loc.get('pano_lat', loc.get('latitude'))
-            region_coords[region].append([lon, lat])
-        
-        print(f"Found {len(region_coords)} regions")
-        
-        # Create features for each region
-        features = []
-        for region, coordinates in sorted(region_coords.items()):
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "region": region
-                },
-                "geometry": {
-                    "type": "MultiPoint",
-                    "coordinates": coordinates
-                }
-            }
-            features.append(feature)
-        
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features
-        }
-        
-        with open(output_file, 'w', encoding='utf-8') as geojsonfile:
-            json.dump(geojson, geojsonfile, indent=2, ensure_ascii=False)
-        
+            valid_locations = []
+        else:
+            # Filter out any null or invalid coordinates as a safety check
+            table = self._valid_table(locations, validate)
+            valid_locations = table.to_dicts()
+
+            filtered_count = len(locations) - len(valid_locations)
+            if filtered_count > 0:
+                print(f"Filtered out {filtered_count} entries with invalid coordinates from GeoJSON")
+
+        # Group by stable-sorting the region column and slicing runs of the
+        # coordinate matrix: each feature's coordinates stay one contiguous
+        # float64 array (16 bytes per point) from here through the encoder,
+        # instead of a Python tuple per point
+        uniq = bounds = None
+        coords = None
+        if valid_locations:
+            print("Grouping coordinates by region...")
+            # Use panorama coordinates if available (for GeoGuessr),
+            # otherwise use photo coordinates
+            lat_col, lon_col = table.export_coords()
+            coords = np.column_stack((lon_col, lat_col))
+            regions = np.array([loc.get('region', 'Unknown') for loc in valid_locations])
+            order = np.argsort(regions, kind='stable')
+            coords = coords[order]
+            regions = regions[order]
+            # First index of each run of equal regions; the runs are the
+            # feature slices, already in region order
+            uniq, starts = np.unique(regions, return_index=True)
+            bounds = np.append(starts, len(regions))
+            print(f"Found {len(uniq)} regions")
+
+        # Stream one feature per region instead of building and serializing
+        # the whole FeatureCollection at once. The feature envelope is static,
+        # so write it as literal byte fragments and only run the encoder over
+        # the two parts that vary: the region name and the coordinate array.
+        # The large buffer batches the many small envelope writes into few syscalls
+        coincident_count = 0
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_BYTES) as geojsonfile:
+            geojsonfile.write(b'{"type":"FeatureCollection","features":[')
+            if uniq is not None:
+                for i, region in enumerate(uniq):
+                    segment = coords[bounds[i]:bounds[i + 1]]
+                    # Burst shots leave stacks of identical points that only
+                    # bloat the file; drop repeats within ~11 cm (6 decimal
+                    # places) per region, keeping each first occurrence
+                    qlat = np.rint(segment[:, 1] * 1e6).astype(np.int64)
+                    qlon = np.rint(segment[:, 0] * 1e6).astype(np.int64)
+                    keys = ((qlat + 90_000_000) << 29) | (qlon + 180_000_000)
+                    _, first_idx = np.unique(keys, return_index=True)
+                    if len(first_idx) < len(segment):
+                        coincident_count += len(segment) - len(first_idx)
+                        segment = segment[np.sort(first_idx)]
+                    if i > 0:
+                        geojsonfile.write(b',')
+                    geojsonfile.write(b'{"type":"Feature","properties":{"region":')
+                    geojsonfile.write(_json_bytes(str(region)))
+                    geojsonfile.write(b'},"geometry":{"type":"MultiPoint","coordinates":')
+                    geojsonfile.write(_json_bytes(segment))
+                    geojsonfile.write(b'}}')
+            geojsonfile.write(b']}')
+
+        if coincident_count > 0:
+            print(f"Dropped {coincident_count} coincident points from GeoJSON")
+
         print(f"GeoJSON file saved to: {output_file.absolute()}")
     
-    def get_statistics(self, locations: List[Dict]) -> Dict:
+    def get_statistics(self, locations: List[Dict], validate: bool = True) -> Dict:
         """
         Get statistics about extracted locations.
         
@@ -682,44 +1688,46 @@ class LocationExtractor:
             }
         
         # Filter out null or invalid coordinates for valid stats
-        valid_locations = []
-        for loc in locations:
-            lat = loc.get('latitude')
-            lon = loc.get('longitude')
-            
-            if lat is None or lon is None:
-                continue
-            
-            # Validate coordinate ranges
-            if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                continue
-            
-            # Skip (0, 0) coordinates as they're often invalid
-            if lat == 0.0 and lon == 0.0:
-                continue
-            
-            valid_locations.append(loc)
-        
+        valid_locations = self._valid_locations(locations, validate)
+
         null_coord_count = len(locations) - len(valid_locations)
         
+        # One fused pass instead of a separate sum() scan per counter: same
+        # counts, a fifth of the list traversals and dict lookups. The date
+        # strings are ISO-formatted, so min/max compare correctly and the
+        # range falls out inline - no date list to build and sort.
+        videos = favorites = with_description = 0
+        earliest = latest = None
+        for loc in valid_locations:
+            if loc['is_video']:
+                videos += 1
+            if loc['is_favorite']:
+                favorites += 1
+            if loc['description']:
+                with_description += 1
+            date = loc['date']
+            if date:
+                if earliest is None or date < earliest:
+                    earliest = date
+                if latest is None or date > latest:
+                    latest = date
+
         stats = {
             'total': len(valid_locations),
-            'photos': sum(1 for loc in valid_locations if not loc['is_video']),
-            'videos': sum(1 for loc in valid_locations if loc['is_video']),
-            'favorites': sum(1 for loc in valid_locations if loc['is_favorite']),
-            'with_description': sum(1 for loc in valid_locations if loc['description']),
+            'photos': len(valid_locations) - videos,
+            'videos': videos,
+            'favorites': favorites,
+            'with_description': with_description,
             'null_coordinates': null_coord_count,
         }
-        
+
         # Calculate date range
-        dates = [loc['date'] for loc in valid_locations if loc['date']]
-        if dates:
-            dates.sort()
+        if earliest is not None:
             stats['date_range'] = {
-                'earliest': dates[0],
-                'latest': dates[-1],
+                'earliest': earliest,
+                'latest': latest,
             }
-        
+
         return stats
 
 
@@ -747,6 +1755,12 @@ def main():
         default='',
         help='Output GeoJSON file path. If not provided, GeoJSON will not be exported.'
     )
+    parser.add_argument(
+        '--parquet',
+        type=str,
+        default='',
+        help='Output Parquet file path (requires pyarrow). If not provided, Parquet will not be exported.'
+    )
     parser.add_argument(
         '--start-from',
         type=str,
@@ -759,6 +1773,25 @@ def main():
         default='',
         help='End date in YYYY-MM-DD format (inclusive). If empty, no end filter.'
     )
+    parser.add_argument(
+        '--sql-scan',
+        action='store_true',
+        help='Read asset rows directly from Photos.sqlite in one query instead of per-photo reads. '
+             'Much faster on large libraries, but region names are not resolved (exported as "Unknown").'
+    )
+    parser.add_argument(
+        '--extract-processes',
+        type=int,
+        default=0,
+        help='Shard photo extraction across this many worker processes (0 = off). '
+             'Each worker loads its own copy of the library, so only worthwhile for large libraries.'
+    )
+    parser.add_argument(
+        '--extract-cache',
+        action='store_true',
+        help='Reuse the on-disk extraction cache (.extract_cache.parquet) when the Photos library '
+             'and filters are unchanged since the last run. Requires pyarrow.'
+    )
     parser.add_argument(
         '--dedupe',
         action='store_true',
@@ -787,14 +1820,51 @@ def main():
         default=None,
         help='Limit number of locations to check for Street View panoramas (for testing). Only applies when --filter-panos is used.'
     )
+    parser.add_argument(
+        '--no-pano-cache',
+        action='store_true',
+        help='Disable the on-disk cache of Street View panorama API responses (.pano_cache.db)'
+    )
+    parser.add_argument(
+        '--pano-workers',
+        type=int,
+        default=16,
+        help='Number of parallel threads for Street View panorama API calls (default: 16)'
+    )
     parser.add_argument(
         '--debug-panos',
         action='store_true',
         help='Print detailed debugging information for Street View panorama API calls'
     )
+    parser.add_argument(
+        '--nearest-pano',
+        type=str,
+        default='',
+        metavar='LAT,LON',
+        help='Query the saved panorama index (.pano_index.npz) for the panoramas nearest to LAT,LON and exit'
+    )
     
     args = parser.parse_args()
-    
+
+    # Answer nearest-panorama queries from the saved index before touching the
+    # Photos library - no library scan or API key needed
+    if args.nearest_pano:
+        try:
+            lat_str, lon_str = args.nearest_pano.split(',')
+            query_lat, query_lon = float(lat_str), float(lon_str)
+        except ValueError:
+            print(f"❌ Error: --nearest-pano expects LAT,LON (got '{args.nearest_pano}')")
+            return
+        try:
+            results = query_pano_index(query_lat, query_lon)
+        except FileNotFoundError as e:
+            print(f"❌ Error: {e}")
+            return
+        print(f"\nNearest panoramas to ({query_lat}, {query_lon}):")
+        for result in results:
+            print(f"  {result['distance_m']:,.1f}m  ({result['pano_lat']}, {result['pano_lon']})  pano_id={result['pano_id']}")
+        return
+
     # Initialize extractor
     extractor = LocationExtractor(photos_db_path=args.photos_db)
     
@@ -803,7 +1873,13 @@ def main():
     end_date = args.end_on if args.end_on else None
     
     # Extract locations
-    locations = extractor.extract_locations(start_date=start_date, end_date=end_date)
+    locations = extractor.extract_locations(
+        start_date=start_date,
+        end_date=end_date,
+        use_sql=args.sql_scan,
+        processes=args.extract_processes,
+        use_cache=args.extract_cache
+    )
     
     # Deduplicate if requested
     original_count = len(locations)
@@ -831,16 +1907,23 @@ def main():
                 api_key=api_key,
                 max_distance_m=args.pano_max_distance,
                 limit=args.api_limit,
-                debug=args.debug_panos
+                debug=args.debug_panos,
+                max_workers=args.pano_workers,
+                use_cache=not args.no_pano_cache
             )
             if pano_filtered_count > 0:
                 print(f"\nFiltered out {pano_filtered_count} locations without Street View panoramas or with panoramas too far away")
                 print(f"({len(locations)} locations with valid panoramas remaining out of {args.api_limit or locations_before} checked)")
             else:
                 print(f"\nAll {len(locations)} locations have valid Street View panoramas")
+            if locations:
+                # Persist pano positions so --nearest-pano works on later runs
+                save_pano_index(locations)
     
     # Show statistics
-    stats = extractor.get_statistics(locations)
+    # extract_locations already validated every coordinate, so the exporters
+    # can skip their defensive re-scan
+    stats = extractor.get_statistics(locations, validate=False)
     print("\n" + "="*50)
     print("STATISTICS")
     print("="*50)
@@ -864,10 +1947,13 @@ def main():
     # Export files only if output paths are provided
     exported_any = False
     if args.csv:
-        extractor.export_to_csv(locations, args.csv)
+        extractor.export_to_csv(locations, args.csv, validate=False)
         exported_any = True
     if args.geojson:
-        extractor.export_to_geojson(locations, args.geojson)
+        extractor.export_to_geojson(locations, args.geojson, validate=False)
+        exported_any = True
+    if args.parquet:
+        extractor.export_to_parquet(locations, args.parquet, validate=False)
         exported_any = True
     
     if exported_any: